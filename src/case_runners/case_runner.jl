@@ -25,10 +25,9 @@ function run_genx_case!(case::AbstractString)
 end
 
 function time_domain_reduced_files_exist(tdrpath)
-    tdr_load = isfile(joinpath(tdrpath,"Load_data.csv"))
-    tdr_genvar = isfile(joinpath(tdrpath,"Generators_variability.csv"))
-    tdr_fuels = isfile(joinpath(tdrpath,"Fuels_data.csv"))
-    return (tdr_load && tdr_genvar && tdr_fuels)
+    # stop stat-ing as soon as one of the clustered files is missing
+    tdr_files = ("Load_data.csv", "Generators_variability.csv", "Fuels_data.csv")
+    return all(f -> isfile(joinpath(tdrpath, f)), tdr_files)
 end
 
 function run_genx_case_simple!(case::AbstractString, mysetup::Dict)
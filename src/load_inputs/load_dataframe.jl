@@ -1,19 +1,20 @@
 @doc raw"""
-    load_dataframe(path::AbstractString)
+    load_dataframe(path::AbstractString; kwargs...)
 
 Attempts to load a dataframe from a csv file with the given path.
 If it's not found immediately, it will look for files with a different case (lower/upper)
 in the file's basename.
+Any keyword arguments (e.g. `select`) are passed on to `CSV.read`.
 """
-function load_dataframe(path::AbstractString)
+function load_dataframe(path::AbstractString; kwargs...)
     if isfile(path)
-        return load_dataframe_from_file(path)
+        return load_dataframe_from_file(path; kwargs...)
     end
 
     # not immediately found
     dir, base = dirname(path), basename(path)
     target = look_for_file_with_alternate_case(dir, base)
-    load_dataframe_from_file(joinpath(dir, target))
+    load_dataframe_from_file(joinpath(dir, target); kwargs...)
 end
 
 function look_for_file_with_alternate_case(dir, base)
@@ -42,10 +43,9 @@ function look_for_file_with_alternate_case(dir, base)
 end
 
 function csv_header(path::AbstractString)
-    f = open(path, "r")
-    header = readline(f)
-    close(f)
-    header
+    open(path, "r") do f
+        readline(f)
+    end
 end
 
 function keep_duplicated_entries!(s, uniques)
@@ -67,9 +67,9 @@ function check_for_duplicate_keys(path::AbstractString)
     end
 end
 
-function load_dataframe_from_file(path)
+function load_dataframe_from_file(path; kwargs...)
     check_for_duplicate_keys(path)
-    CSV.read(path, DataFrame, header=1)
+    CSV.read(path, DataFrame; header=1, kwargs...)
 end
 
 @doc raw"""
@@ -160,8 +160,9 @@ function load_generators_data!(setup::Dict, path::AbstractString, inputs_gen::Di
                        :Start_Cost_per_MW,             # to $M/GW
                       ]
 
+    existing_columns = Set(names(gen_in))
     for column in columns_to_scale
-        if string(column) in names(gen_in)
+        if string(column) in existing_columns
             gen_in[!, column] /= scale_factor
         end
     end
@@ -17,12 +17,10 @@ function load_generators_variability!(setup::Dict, path::AbstractString, inputs:
 
     all_resources = inputs["RESOURCES"]
 
-    existing_variability = names(gen_var)
-    for r in all_resources
-        if r ∉ existing_variability
-            @info "assuming availability of 1.0 for resource $r."
-            ensure_column!(gen_var, r, 1.0)
-        end
+    missing_variability = setdiff(all_resources, names(gen_var))
+    for r in missing_variability
+        @info "assuming availability of 1.0 for resource $r."
+        ensure_column!(gen_var, r, 1.0)
     end
 
 	# Reorder DataFrame to R_ID order (order provided in Generators_data.csv)
@@ -145,7 +145,8 @@ already has more than one Representative Period or has more than one Sub_Weight
 function prevent_doubled_timedomainreduction(path::AbstractString)
 
     filename = "Load_data.csv"
-    load_in = load_dataframe(joinpath(path, filename))
+    # only the period columns are needed; skip parsing the hourly load profiles
+    load_in = load_dataframe(joinpath(path, filename), select=[:Rep_Periods, :Sub_Weights])
     as_vector(col::Symbol) = collect(skipmissing(load_in[!, col]))
     representative_periods = convert(Int16, as_vector(:Rep_Periods)[1])
     sub_weights = as_vector(:Sub_Weights)
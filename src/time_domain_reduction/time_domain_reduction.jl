@@ -128,24 +128,15 @@ function parse_multi_stage_data(inputs_dict)
     for r in 1:length(RESOURCE_ZONES)
         if occursin("PV", RESOURCE_ZONES[r]) || occursin("pv", RESOURCE_ZONES[r]) || occursin("Pv", RESOURCE_ZONES[r]) || occursin("Solar", RESOURCE_ZONES[r]) || occursin("SOLAR", RESOURCE_ZONES[r]) || occursin("solar", RESOURCE_ZONES[r])
             push!(solar_col_names, RESOURCE_ZONES[r])
-            pv_all_stages = []
-            for t in 1:length(keys(inputs_dict))
-                pv_all_periods = vcat(pv_all_stages, inputs_dict[t]["pP_Max"][r,:])
-            end
+            pv_all_stages = reduce(vcat, [inputs_dict[t]["pP_Max"][r,:] for t in 1:length(keys(inputs_dict))])
             push!(solar_profiles, pv_all_stages)
         elseif occursin("Wind", RESOURCE_ZONES[r]) || occursin("WIND", RESOURCE_ZONES[r]) || occursin("wind", RESOURCE_ZONES[r])
             push!(wind_col_names, RESOURCE_ZONES[r])
-            wind_all_stages = []
-            for t in 1:length(keys(inputs_dict))
-                wind_all_stages = vcat(wind_all_stages, inputs_dict[t]["pP_Max"][r,:])
-            end
+            wind_all_stages = reduce(vcat, [inputs_dict[t]["pP_Max"][r,:] for t in 1:length(keys(inputs_dict))])
             push!(wind_profiles, wind_all_stages)
         end
         push!(var_col_names, RESOURCE_ZONES[r])
-        var_all_stages = []
-        for t in 1:length(keys(inputs_dict))
-            var_all_stages = vcat(var_all_stages, inputs_dict[t]["pP_Max"][r,:])
-        end
+        var_all_stages = reduce(vcat, [inputs_dict[t]["pP_Max"][r,:] for t in 1:length(keys(inputs_dict))])
         push!(var_profiles, var_all_stages)
         col_to_zone_map[RESOURCE_ZONES[r]] = ZONES[r]
     end
@@ -155,13 +146,12 @@ function parse_multi_stage_data(inputs_dict)
     fuel_profiles = []
     AllFuelsConst = true
     for f in 1:length(fuel_col_names)
-        fuel_all_stages = []
         for t in 1:length(keys(inputs_dict))
-            fuel_all_stages = vcat(fuel_all_stages, inputs_dict[t]["fuel_costs"][fuel_col_names[f]])
             if AllFuelsConst && (minimum(inputs_dict[t]["fuel_costs"][fuel_col_names[f]]) != maximum(inputs_dict[t]["fuel_costs"][fuel_col_names[f]]))
                 AllFuelsConst = false
             end
         end
+        fuel_all_stages = reduce(vcat, [inputs_dict[t]["fuel_costs"][fuel_col_names[f]] for t in 1:length(keys(inputs_dict))])
         push!(fuel_profiles, fuel_all_stages)
     end
 
@@ -465,6 +455,26 @@ function get_load_multipliers(ClusterOutputData, InputData, M, W, LoadCols, Time
     return load_mults
 end
 
+@doc raw"""
+    load_data_without_profiles(path, LoadCols)
+
+Reads Load_data.csv without the load profile columns (LoadCols) and Time_Index,
+which are replaced by their clustered versions. Throws an error if any of them
+is missing from the file's header, rather than silently skipping it.
+"""
+function load_data_without_profiles(path, LoadCols)
+    drop_cols = [LoadCols; :Time_Index]
+    if !isfile(path)
+        path = joinpath(dirname(path), look_for_file_with_alternate_case(dirname(path), basename(path)))
+    end
+    header = Symbol.(strip.(split(csv_header(path), ',')))
+    missing_cols = setdiff(drop_cols, header)
+    if !isempty(missing_cols)
+        error("Columns $missing_cols were not found in $path")
+    end
+    load_dataframe(path, drop=drop_cols)
+end
+
 
 @doc raw"""
     cluster_inputs(inpath, settings_path, v=false, norm_plot=false, silh_plot=false, res_plots=false, indiv_plots=false, pair_plots=false)
@@ -881,10 +891,10 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
     end
 
     # Reorganize Data by Load, Solar, Wind, Fuel, and GrpWeight by Hour, Add Constant Data Back In
-    rpDFs = [] # Representative Period DataFrames - All Profiles (Load, Resource, Fuel)
-    gvDFs = [] # Generators Variability DataFrames - Just Resource Profiles
-    lpDFs = [] # Load Profile DataFrames - Just Load Profiles
-    fpDFs = [] # Fuel Profile DataFrames - Just Fuel Profiles
+    rpDFs = DataFrame[] # Representative Period DataFrames - All Profiles (Load, Resource, Fuel)
+    gvDFs = DataFrame[] # Generators Variability DataFrames - Just Resource Profiles
+    lpDFs = DataFrame[] # Load Profile DataFrames - Just Load Profiles
+    fpDFs = DataFrame[] # Fuel Profile DataFrames - Just Fuel Profiles
 
     for m in 1:NClusters
         rpDF = DataFrame( Dict( NewColNames[i] => ClusterOutputData[!,m][TimestepsPerRepPeriod*(i-1)+1 : TimestepsPerRepPeriod*i] for i in 1:Ncols) )
@@ -923,16 +933,16 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
         push!(lpDFs, lpDF)
         push!(fpDFs, fpDF)
     end
-    FinalOutputData = vcat(rpDFs...)  # For comparisons with input data to evaluate clustering process
-    GVOutputData = vcat(gvDFs...)     # Generators Variability
-    LPOutputData = vcat(lpDFs...)     # Load Profiles
-    FPOutputData = vcat(fpDFs...)     # Fuel Profiles
+    FinalOutputData = reduce(vcat, rpDFs)  # For comparisons with input data to evaluate clustering process
+    GVOutputData = reduce(vcat, gvDFs)     # Generators Variability
+    LPOutputData = reduce(vcat, lpDFs)     # Load Profiles
+    FPOutputData = reduce(vcat, fpDFs)     # Fuel Profiles
 
 
     ##### Step 5: Evaluation
 
     InputDataTest = InputData[(InputData.Group .<= NumDataPoints*1.0), :]
-    ClusterDataTest = vcat([rpDFs[a] for a in A]...) # To compare fairly, load is not scaled here
+    ClusterDataTest = reduce(vcat, [rpDFs[a] for a in A]) # To compare fairly, load is not scaled here
     RMSE = Dict( c => rmse_score(InputDataTest[:, c], ClusterDataTest[:, c])  for c in OldColNames)
 
     ##### Step 6: Print to File
@@ -965,23 +975,14 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
 
                 # Save output data to stage-specific locations
                 ### TDR_Results/Load_data_clustered.csv
-                load_in = load_dataframe(joinpath(inpath, "Inputs", "Inputs_p$per", "Load_data.csv"))
+                load_in = load_data_without_profiles(joinpath(inpath, "Inputs", "Inputs_p$per", "Load_data.csv"), LoadCols)
                 load_in[!,:Sub_Weights] = load_in[!,:Sub_Weights] * 1.
                 load_in[1:length(Stage_Weights[per]),:Sub_Weights] .= Stage_Weights[per]
                 load_in[!,:Rep_Periods][1] = length(Stage_Weights[per])
                 load_in[!,:Timesteps_per_Rep_Period][1] = TimestepsPerRepPeriod
-                select!(load_in, Not(LoadCols))
-                select!(load_in, Not(:Time_Index))
-                Time_Index_M = Union{Int64, Missings.Missing}[missing for i in 1:size(load_in,1)]
-                Time_Index_M[1:size(LPOutputData,1)] = 1:size(LPOutputData,1)
-                load_in[!,:Time_Index] .= Time_Index_M
-
-                for c in LoadCols
-                    new_col = Union{Float64, Missings.Missing}[missing for i in 1:size(load_in,1)]
-                    new_col[1:size(LPOutputData,1)] = LPOutputData[!,c]
-                    load_in[!,c] .= new_col
-                end
                 load_in = load_in[1:size(LPOutputData,1),:]
+                load_in[!,:Time_Index] = 1:size(LPOutputData,1)
+                load_in = hcat(load_in, LPOutputData[!, LoadCols])
 
                 if v println("Writing load file...") end
                 CSV.write(joinpath(inpath, "Inputs", Stage_Outfiles[per]["Load"]), load_in)
@@ -997,7 +998,7 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
                 CSV.write(joinpath(inpath, "Inputs", Stage_Outfiles[per]["GVar"]), GVOutputData, header=NewGVColNames)
 
                 ### TDR_Results/Fuels_data.csv
-                fuel_in = load_dataframe(joinpath(inpath, "Inputs", "Inputs_p$per", "Fuels_data.csv"))
+                fuel_in = load_dataframe(joinpath(inpath, "Inputs", "Inputs_p$per", "Fuels_data.csv"), limit=1)
                 select!(fuel_in, Not(:Time_Index))
                 SepFirstRow = DataFrame(fuel_in[1, :])
                 NewFuelOutput = vcat(SepFirstRow, FPOutputData)
@@ -1023,23 +1024,14 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
             mkpath(joinpath(inpath,"Inputs",input_stage_directory, TimeDomainReductionFolder))
 
             ### TDR_Results/Load_data.csv
-            load_in = load_dataframe(joinpath(inpath, "Inputs", input_stage_directory, "Load_data.csv"))
+            load_in = load_data_without_profiles(joinpath(inpath, "Inputs", input_stage_directory, "Load_data.csv"), LoadCols)
             load_in[!,:Sub_Weights] = load_in[!,:Sub_Weights] * 1.
             load_in[1:length(W),:Sub_Weights] .= W
             load_in[!,:Rep_Periods][1] = length(W)
             load_in[!,:Timesteps_per_Rep_Period][1] = TimestepsPerRepPeriod
-            select!(load_in, Not(LoadCols))
-            select!(load_in, Not(:Time_Index))
-            Time_Index_M = Union{Int64, Missings.Missing}[missing for i in 1:size(load_in,1)]
-            Time_Index_M[1:size(LPOutputData,1)] = 1:size(LPOutputData,1)
-            load_in[!,:Time_Index] .= Time_Index_M
-
-            for c in LoadCols
-                new_col = Union{Float64, Missings.Missing}[missing for i in 1:size(load_in,1)]
-                new_col[1:size(LPOutputData,1)] = LPOutputData[!,c]
-                load_in[!,c] .= new_col
-            end
             load_in = load_in[1:size(LPOutputData,1),:]
+            load_in[!,:Time_Index] = 1:size(LPOutputData,1)
+            load_in = hcat(load_in, LPOutputData[!, LoadCols])
 
             if v println("Writing load file...") end
             CSV.write(joinpath(inpath,"Inputs",input_stage_directory,Load_Outfile), load_in)
@@ -1057,7 +1049,7 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
 
             ### TDR_Results/Fuels_data.csv
 
-            fuel_in = load_dataframe(joinpath(inpath,"Inputs",input_stage_directory,"Fuels_data.csv"))
+            fuel_in = load_dataframe(joinpath(inpath,"Inputs",input_stage_directory,"Fuels_data.csv"), limit=1)
             select!(fuel_in, Not(:Time_Index))
             SepFirstRow = DataFrame(fuel_in[1, :])
             NewFuelOutput = vcat(SepFirstRow, FPOutputData)
@@ -1079,23 +1071,14 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
         mkpath(joinpath(inpath, TimeDomainReductionFolder))
 
         ### TDR_Results/Load_data.csv
-        load_in = load_dataframe(joinpath(inpath, "Load_data.csv"))
+        load_in = load_data_without_profiles(joinpath(inpath, "Load_data.csv"), LoadCols)
         load_in[!,:Sub_Weights] = load_in[!,:Sub_Weights] * 1.
         load_in[1:length(W),:Sub_Weights] .= W
         load_in[!,:Rep_Periods][1] = length(W)
         load_in[!,:Timesteps_per_Rep_Period][1] = TimestepsPerRepPeriod
-        select!(load_in, Not(LoadCols))
-        select!(load_in, Not(:Time_Index))
-        Time_Index_M = Union{Int64, Missings.Missing}[missing for i in 1:size(load_in,1)]
-        Time_Index_M[1:size(LPOutputData,1)] = 1:size(LPOutputData,1)
-        load_in[!,:Time_Index] .= Time_Index_M
-
-        for c in LoadCols
-            new_col = Union{Float64, Missings.Missing}[missing for i in 1:size(load_in,1)]
-            new_col[1:size(LPOutputData,1)] = LPOutputData[!,c]
-            load_in[!,c] .= new_col
-        end
         load_in = load_in[1:size(LPOutputData,1),:]
+        load_in[!,:Time_Index] = 1:size(LPOutputData,1)
+        load_in = hcat(load_in, LPOutputData[!, LoadCols])
 
         if v println("Writing load file...") end
         CSV.write(joinpath(inpath, Load_Outfile), load_in)
@@ -1113,7 +1096,7 @@ function cluster_inputs(inpath, settings_path, mysetup, stage_id=-99, v=false)
 
         ### TDR_Results/Fuels_data.csv
 
-        fuel_in = load_dataframe(joinpath(inpath, "Fuels_data.csv"))
+        fuel_in = load_dataframe(joinpath(inpath, "Fuels_data.csv"), limit=1)
         select!(fuel_in, Not(:Time_Index))
         SepFirstRow = DataFrame(fuel_in[1, :])
         NewFuelOutput = vcat(SepFirstRow, FPOutputData)
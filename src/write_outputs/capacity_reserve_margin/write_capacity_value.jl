@@ -41,10 +41,14 @@ function write_capacity_value(path::AbstractString, inputs::Dict, setup::Dict, E
 		temp_capvalue[MUST_RUN_EX, :] = temp_cap_derate[MUST_RUN_EX, :] .* (inputs["pP_Max"][MUST_RUN_EX, :]) .* temp_riskyhour[MUST_RUN_EX, :]
 		temp_capvalue[HYDRO_RES_EX, :] = temp_cap_derate[HYDRO_RES_EX, :] .* (value.(EP[:vP][HYDRO_RES_EX, :])) .* temp_riskyhour[HYDRO_RES_EX, :] ./ totalcap[HYDRO_RES_EX, :]
 		if !isempty(STOR_ALL_EX)
-			temp_capvalue[STOR_ALL_EX, :] = temp_cap_derate[STOR_ALL_EX, :] .* ((value.(EP[:vP][STOR_ALL_EX, :]) - value.(EP[:vCHARGE][STOR_ALL_EX, :]).data)) .* temp_riskyhour[STOR_ALL_EX, :] ./ totalcap[STOR_ALL_EX, :]
+			stor_power = value.(EP[:vP][STOR_ALL_EX, :])
+			stor_charge = value.(EP[:vCHARGE][STOR_ALL_EX, :]).data
+			@views temp_capvalue[STOR_ALL_EX, :] .= temp_cap_derate[STOR_ALL_EX, :] .* (stor_power .- stor_charge) .* temp_riskyhour[STOR_ALL_EX, :] ./ totalcap[STOR_ALL_EX, :]
 		end
 		if !isempty(FLEX_EX)
-			temp_capvalue[FLEX_EX, :] = temp_cap_derate[FLEX_EX, :] .* ((value.(EP[:vCHARGE_FLEX][FLEX_EX, :]).data - value.(EP[:vP][FLEX_EX, :]))) .* temp_riskyhour[FLEX_EX, :] ./ totalcap[FLEX_EX, :]
+			flex_charge = value.(EP[:vCHARGE_FLEX][FLEX_EX, :]).data
+			flex_power = value.(EP[:vP][FLEX_EX, :])
+			@views temp_capvalue[FLEX_EX, :] .= temp_cap_derate[FLEX_EX, :] .* (flex_charge .- flex_power) .* temp_riskyhour[FLEX_EX, :] ./ totalcap[FLEX_EX, :]
 		end
 		temp_dfCapValue = hcat(temp_dfCapValue, DataFrame(temp_capvalue, :auto))
 		auxNew_Names = [Symbol("Resource"); Symbol("Zone"); Symbol("Reserve"); [Symbol("t$t") for t in 1:T]]
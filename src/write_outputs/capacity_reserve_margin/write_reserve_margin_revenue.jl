@@ -20,24 +20,35 @@ function write_reserve_margin_revenue(path::AbstractString, inputs::Dict, setup:
 	MUST_RUN = inputs["MUST_RUN"]
 	dfResRevenue = DataFrame(Region = dfGen.region, Resource = inputs["RESOURCES"], Zone = dfGen.Zone, Cluster = dfGen.cluster)
 	annual_sum = zeros(G)
+	therm_cap = value.(EP[:eTotalCap][THERM_ALL])
+	vre_cap = value.(EP[:eTotalCap][VRE])
+	must_run_cap = value.(EP[:eTotalCap][MUST_RUN])
+	hydro_power = value.(EP[:vP][HYDRO_RES, :])
+	if !isempty(STOR_ALL)
+		stor_net = value.(EP[:vP][STOR_ALL, :]) - value.(EP[:vCHARGE][STOR_ALL, :]).data
+	end
+	if !isempty(FLEX)
+		flex_net = value.(EP[:vCHARGE_FLEX][FLEX, :]).data - value.(EP[:vP][FLEX, :])
+	end
 	for i in 1:inputs["NCapacityReserveMargin"]
 		sym = Symbol("CapRes_$i")
+		capres_dual = dual.(EP[:cCapacityResMargin][i, :])
 		tempresrev = zeros(G)
-		tempresrev[THERM_ALL] = dfGen[THERM_ALL, sym] .* (value.(EP[:eTotalCap][THERM_ALL])) * sum(dual.(EP[:cCapacityResMargin][i, :]))
-		tempresrev[VRE] = dfGen[VRE, sym] .* (value.(EP[:eTotalCap][VRE])) .* (inputs["pP_Max"][VRE, :] * (dual.(EP[:cCapacityResMargin][i, :])))
-		tempresrev[MUST_RUN] = dfGen[MUST_RUN, sym] .* (value.(EP[:eTotalCap][MUST_RUN])) .* (inputs["pP_Max"][MUST_RUN, :] * (dual.(EP[:cCapacityResMargin][i, :])))
-		tempresrev[HYDRO_RES] = dfGen[HYDRO_RES, sym] .* (value.(EP[:vP][HYDRO_RES, :]) * (dual.(EP[:cCapacityResMargin][i, :])))
+		tempresrev[THERM_ALL] = dfGen[THERM_ALL, sym] .* therm_cap * sum(capres_dual)
+		tempresrev[VRE] = dfGen[VRE, sym] .* vre_cap .* (inputs["pP_Max"][VRE, :] * capres_dual)
+		tempresrev[MUST_RUN] = dfGen[MUST_RUN, sym] .* must_run_cap .* (inputs["pP_Max"][MUST_RUN, :] * capres_dual)
+		tempresrev[HYDRO_RES] = dfGen[HYDRO_RES, sym] .* (hydro_power * capres_dual)
 		if !isempty(STOR_ALL)
-			tempresrev[STOR_ALL] = dfGen[STOR_ALL, sym] .* ((value.(EP[:vP][STOR_ALL, :]) - value.(EP[:vCHARGE][STOR_ALL, :]).data) * (dual.(EP[:cCapacityResMargin][i, :])))
+			tempresrev[STOR_ALL] = dfGen[STOR_ALL, sym] .* (stor_net * capres_dual)
 		end
 		if !isempty(FLEX)
-			tempresrev[FLEX] = dfGen[FLEX, sym] .* ((value.(EP[:vCHARGE_FLEX][FLEX, :]).data - value.(EP[:vP][FLEX, :])) * (dual.(EP[:cCapacityResMargin][i, :])))
+			tempresrev[FLEX] = dfGen[FLEX, sym] .* (flex_net * capres_dual)
 		end
 		if setup["ParameterScale"] == 1
 			tempresrev *= ModelScalingFactor^2
 		end
 		annual_sum .+= tempresrev
-		dfResRevenue = hcat(dfResRevenue, DataFrame([tempresrev], [sym]))
+		dfResRevenue[!, sym] = tempresrev
 	end
 	dfResRevenue.AnnualSum = annual_sum
 	CSV.write(joinpath(path, "ReserveMarginRevenue.csv"), dfResRevenue)
@@ -11,7 +11,7 @@ function write_emissions(path::AbstractString, inputs::Dict, setup::Dict, EP::Mo
 	Z = inputs["Z"]     # Number of zones
 
 	scale_factor = setup["ParameterScale"] == 1 ? ModelScalingFactor : 1
-
+	emissions_by_zone = value.(EP[:eEmissionsByZone]) * scale_factor
 
 	if (setup["WriteShadowPrices"]==1 || setup["UCommit"]==0 || (setup["UCommit"]==2 && (setup["Reserves"]==0 || (setup["Reserves"]>0 && inputs["pDynamic_Contingency"]==0)))) # fully linear model
 		# CO2 emissions by zone
@@ -35,27 +35,20 @@ function write_emissions(path::AbstractString, inputs::Dict, setup::Dict, EP::Mo
 			dfEmissions = DataFrame(Zone = 1:Z, AnnualSum = Array{Float64}(undef, Z))
 		end
 
-		for i in 1:Z
-			dfEmissions[i,:AnnualSum] = sum(inputs["omega"].*value.(EP[:eEmissionsByZone][i,:]))*scale_factor
-		end
-
-		dfEmissions = hcat(dfEmissions, DataFrame(value.(EP[:eEmissionsByZone])*scale_factor, :auto))
+		dfEmissions.AnnualSum .= emissions_by_zone * inputs["omega"]
+		dfEmissions = hcat(dfEmissions, DataFrame(emissions_by_zone, :auto))
 
 
 		if setup["CO2Cap"]>=1
 			auxNew_Names=[Symbol("Zone");[Symbol("CO2_Price_$cap") for cap in 1:inputs["NCO2Cap"]];Symbol("AnnualSum");[Symbol("t$t") for t in 1:T]]
 			rename!(dfEmissions,auxNew_Names)
 			total = DataFrame(["Total" zeros(1,inputs["NCO2Cap"]) sum(dfEmissions[!,:AnnualSum]) fill(0.0, (1,T))], :auto)
-			for t in 1:T
-				total[:,t+inputs["NCO2Cap"]+2] .= sum(dfEmissions[:,Symbol("t$t")][1:Z])
-			end
+			total[:, (inputs["NCO2Cap"]+3):(inputs["NCO2Cap"]+T+2)] .= sum(emissions_by_zone, dims = 1)
 		else
 			auxNew_Names=[Symbol("Zone"); Symbol("AnnualSum"); [Symbol("t$t") for t in 1:T]]
 			rename!(dfEmissions,auxNew_Names)
 			total = DataFrame(["Total" sum(dfEmissions[!,:AnnualSum]) fill(0.0, (1,T))], :auto)
-			for t in 1:T
-				total[:,t+2] .= sum(dfEmissions[:,Symbol("t$t")][1:Z])
-			end
+			total[:, 3:T+2] .= sum(emissions_by_zone, dims = 1)
 		end
         rename!(total,auxNew_Names)
         dfEmissions = vcat(dfEmissions, total)
@@ -65,16 +58,12 @@ function write_emissions(path::AbstractString, inputs::Dict, setup::Dict, EP::Mo
 	else
 		# CO2 emissions by zone
 		dfEmissions = hcat(DataFrame(Zone = 1:Z), DataFrame(AnnualSum = Array{Float64}(undef, Z)))
-		for i in 1:Z
-			dfEmissions[i,:AnnualSum] = sum(inputs["omega"].*value.(EP[:eEmissionsByZone][i,:])) * scale_factor
-		end
-		dfEmissions = hcat(dfEmissions, DataFrame(value.(EP[:eEmissionsByZone]) * scale_factor, :auto))
+		dfEmissions.AnnualSum .= emissions_by_zone * inputs["omega"]
+		dfEmissions = hcat(dfEmissions, DataFrame(emissions_by_zone, :auto))
 		auxNew_Names=[Symbol("Zone");Symbol("AnnualSum");[Symbol("t$t") for t in 1:T]]
 		rename!(dfEmissions,auxNew_Names)
 		total = DataFrame(["Total" sum(dfEmissions[!,:AnnualSum]) fill(0.0, (1,T))], :auto)
-		for t in 1:T
-			total[:,t+2] .= sum(dfEmissions[:,Symbol("t$t")][1:Z])
-		end
+		total[:, 3:T+2] .= sum(emissions_by_zone, dims = 1)
 		rename!(total,auxNew_Names)
 		dfEmissions = vcat(dfEmissions, total)
 	end